@@ -3,22 +3,22 @@ PDF extraction module: text, tables, and OCR fallback
 Handles digital PDFs and scanned images
 """
 
-import json
+import contextlib
+import csv
+import io
 import os
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import logging
 
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     import fitz  # PyMuPDF
 except ImportError:
     fitz = None
 
-try:
-    import camelot
-except ImportError:
-    camelot = None
-
 try:
     from PIL import Image
     import pytesseract
@@ -28,11 +28,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-
 class PDFExtractor:
     """Extract text, tables, and apply OCR from PDF files"""
     
     def __init__(self):
+        # OpenMP threads inside Tesseract oversubscribe cores when several
+        # pages or documents are OCR'd at once; keep each run single-threaded
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
         self.tesseract_available = self._check_tesseract()
     
     def _check_tesseract(self) -> bool:
@@ -47,10 +49,14 @@ class PDFExtractor:
             logger.warning(f"Tesseract not available: {e}")
             return False
     
-    def extract_from_pdf(self, pdf_path: str) -> Dict:
+    def extract_from_pdf(self, pdf_path: str, ocr_workers: Optional[int] = None) -> Dict:
         """
         Extract text, tables, and metadata from PDF
         
+        ocr_workers caps the concurrent Tesseract runs for this document
+        (default: one per core). Callers that already run one extraction per
+        core should pass 1.
+        
         Returns:
             {
                 "doc_id": str,
@@ -81,54 +87,65 @@ class PDFExtractor:
             logger.error(f"Failed to open PDF {pdf_path}: {e}")
             raise
         
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_data = {
-                "page_num": page_num + 1,
-                "text": "",
-                "tables": [],
-                "ocr_used": False
-            }
+        # One Document serves text, table and render passes, and is closed even
+        # if a page fails. PyMuPDF is not thread-safe, so pages are read and
+        # rendered here; only the Tesseract runs (external processes) go to the pool
+        ocr_jobs = {}
+        with contextlib.closing(doc), ThreadPoolExecutor(max_workers=ocr_workers or os.cpu_count()) as pool:
+            for page_num in range(len(doc)):
+                page = doc[page_num]
+                page_data = {
+                    "page_num": page_num + 1,
+                    "text": "",
+                    "tables": [],
+                    "ocr_used": False
+                }
+                
+                # Try text extraction first
+                text = page.get_text("text")
+                page_data["text"] = text
+                
+                # If text is too sparse (whitespace/boilerplate only), queue the page for OCR
+                if self.tesseract_available and sum(ch.isalnum() for ch in text) < 30:
+                    logger.info(f"Page {page_num + 1}: Sparse text (<30 alphanumeric chars), trying OCR")
+                    img = self._render_page(page, page_num)
+                    if img is not None:
+                        ocr_jobs[page_num] = pool.submit(self._ocr_image, img, page_num)
+                
+                # Table extraction reuses the already-open page
+                page_data["tables"] = self._extract_tables_from_page(page, page_num + 1)
+                
+                result["pages"].append(page_data)
             
-            # Try text extraction first
-            text = page.get_text()
-            page_data["text"] = text
-            
-            # If text is too sparse, try OCR
-            if len(text.strip()) < 50 and self.tesseract_available:
-                logger.info(f"Page {page_num + 1}: Sparse text (<50 chars), trying OCR")
-                ocr_text = self._ocr_page(page, page_num)
+            for page_num, job in ocr_jobs.items():
+                ocr_text = job.result()
                 if ocr_text:
+                    page_data = result["pages"][page_num]
                     page_data["text"] = ocr_text
                     page_data["ocr_used"] = True
                     result["ocr_used_pages"].append(page_num + 1)
-            
-            # Try table extraction with camelot (requires external file)
-            if camelot:
-                try:
-                    tables = self._extract_tables_from_page(pdf_path, page_num + 1)
-                    page_data["tables"] = tables
-                except Exception as e:
-                    logger.debug(f"Table extraction failed for page {page_num + 1}: {e}")
-            
-            result["pages"].append(page_data)
         
-        doc.close()
         return result
     
-    def _ocr_page(self, page: "fitz.Page", page_num: int) -> str:
-        """Apply OCR to PDF page using Tesseract"""
+    def _render_page(self, page: "fitz.Page", page_num: int) -> Optional["Image.Image"]:
+        """Render PDF page to an image for OCR"""
         if not pytesseract or not Image:
-            return ""
+            return None
         
         try:
-            # Render page to image
-            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x zoom for better OCR
-            img_data = pix.tobytes("png")
-            
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", [pix.width, pix.height], img_data)
+            # Render page straight to grayscale: Tesseract binarizes anyway, and
+            # 1.5x zoom keeps body text legible at a third of the RGB bytes
+            pix = page.get_pixmap(matrix=fitz.Matrix(1.5, 1.5), colorspace=fitz.csGRAY, alpha=False)
             
+            # Wrap the raw samples as a PIL Image (no PNG encode/decode)
+            return Image.frombytes("L", [pix.width, pix.height], pix.samples)
+        except Exception as e:
+            logger.error(f"Rendering failed for page {page_num}: {e}")
+            return None
+    
+    def _ocr_image(self, img: "Image.Image", page_num: int) -> str:
+        """Apply OCR to a rendered page using Tesseract"""
+        try:
             # Run OCR
             text = pytesseract.image_to_string(img)
             logger.info(f"OCR extracted {len(text)} chars from page {page_num}")
@@ -137,40 +154,29 @@ class PDFExtractor:
             logger.error(f"OCR failed for page {page_num}: {e}")
             return ""
     
-    def _extract_tables_from_page(self, pdf_path: str, page_num: int) -> List[str]:
-        """Extract tables from specific page using Camelot"""
+    def _extract_tables_from_page(self, page: "fitz.Page", page_num: int) -> List[str]:
+        """Extract tables from page using PyMuPDF's table finder"""
         try:
-            # Try lattice method first (for bordered tables)
-            tables_lattice = camelot.read_pdf(
-                pdf_path,
-                pages=str(page_num),
-                flavor="lattice"
-            )
-            
-            # Also try stream method (for borderless tables)
-            tables_stream = camelot.read_pdf(
-                pdf_path,
-                pages=str(page_num),
-                flavor="stream"
-            )
-            
-            all_tables = list(tables_lattice) + list(tables_stream)
+            tables = page.find_tables().tables
             
             # Convert to CSV strings for storage
             result = []
-            for table in all_tables:
-                csv_str = table.to_csv()
-                result.append(csv_str)
+            for table in tables:
+                buf = io.StringIO()
+                csv.writer(buf, lineterminator="\n").writerows(
+                    ["" if cell is None else cell for cell in row] for row in table.extract()
+                )
+                result.append(buf.getvalue())
             
             return result
         except Exception as e:
-            logger.debug(f"Camelot table extraction failed: {e}")
+            logger.debug(f"Table extraction failed for page {page_num}: {e}")
             return []
     
     def serialize_extraction(self, extraction: Dict) -> str:
         """Serialize extraction result to JSON"""
-        return json.dumps(extraction, indent=2, default=str)
+        return orjson.dumps(extraction, option=orjson.OPT_INDENT_2, default=str).decode()
     
     def deserialize_extraction(self, json_str: str) -> Dict:
         """Deserialize extraction result from JSON"""
-        return json.loads(json_str)
+        return orjson.loads(json_str)
@@ -1,34 +1,115 @@
+import bisect
+import os
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from .schemas import ExtractionResult, KPIField, FieldEvidence, DocumentType
+import msgspec
 
+from .schemas import ExtractionResult, KPIField, FieldEvidence, DocumentType, RawExtraction
 
-DATE_PATTERNS = [
-    "%d/%m/%Y",
-    "%d %B %Y",
-    "%d %b %Y",
-    "%Y-%m-%d",
-    "%B %d, %Y",
-    "%b %d, %Y",
+try:
+    import re2  # google-re2: linear-time matching, no backtracking blowups
+except ImportError:
+    re2 = None
+
+
+# All-numeric dates are split and built directly; named-month dates are
+# classified by shape so strptime is only tried with formats that can match
+_NUMERIC_DATE_RES = [
+    re.compile(r"(?P<d>\d{1,2})/(?P<m>\d{1,2})/(?P<y>\d{4})"),
+    re.compile(r"(?P<y>\d{4})-(?P<m>\d{1,2})-(?P<d>\d{1,2})"),
+    re.compile(r"(?P<d>\d{1,2})-(?P<m>\d{1,2})-(?P<y>\d{4})"),
+]
+_DATE_SHAPES = [
+    (re.compile(r"\d{1,2}\s+[A-Za-z]+\s+\d{4}"), ("%d %B %Y", "%d %b %Y")),
+    (re.compile(r"[A-Za-z]+\s+\d{1,2},\s+\d{4}"), ("%B %d, %Y", "%b %d, %Y")),
 ]
 
 
-def parse_date(text: str) -> Optional[datetime]:
-    """Parse date string using multiple formats"""
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> Optional[date]:
+    """Parse date string using multiple formats
+
+    Results are memoized (dates repeat across fields and filings); long-running
+    callers can bound memory with parse_date.cache_clear().
+    """
     text = text.strip()
-    for fmt in DATE_PATTERNS:
-        try:
-            return datetime.strptime(text, fmt)
-        except ValueError:
-            continue
+    # every supported shape is at least 8 characters and ends in a digit
+    if len(text) < 8 or not text[-1].isdigit():
+        return None
+    for pattern in _NUMERIC_DATE_RES:
+        m = pattern.fullmatch(text)
+        if m:
+            try:
+                return date(int(m["y"]), int(m["m"]), int(m["d"]))
+            except ValueError:
+                return None
+    for shape, formats in _DATE_SHAPES:
+        if shape.fullmatch(text):
+            for fmt in formats:
+                try:
+                    return datetime.strptime(text, fmt).date()
+                except ValueError:
+                    continue
+            return None
     return None
 
 
-def find_pattern(text: str, pattern: str, flags=0) -> Optional[re.Match]:
-    """Find regex pattern in text"""
-    return re.search(pattern, text, flags)
+def _compile(pattern: str, flags: int = 0):
+    """Compile pattern with RE2 when installed, otherwise with re"""
+    if re2 is not None:
+        inline = ("i" if flags & re.IGNORECASE else "") + ("s" if flags & re.DOTALL else "")
+        return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+    return re.compile(pattern, flags)
+
+
+# Field patterns, compiled once at import rather than on every parse() call.
+# Patterns must stay RE2-compatible: no lookarounds or backreferences.
+_COMPANY_NAME_RE = _compile(r"(?:Entity name|Name of \+Entity)\s+([A-Z][^\n]+)", re.IGNORECASE)
+_TICKER_RE = _compile(r"(?:ASX\s+(?:\+)?[Ss]ecurity\s+[Cc]ode|ASX issuer code)\s+([A-Z]{1,5})\b", re.IGNORECASE)
+_ISIN_RE = _compile(r"\b(AU[0-9A-Z]{10})\b", re.IGNORECASE)
+_EX_DATE_RE = _compile(r"Ex\s*Date\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})", re.IGNORECASE)
+_RECORD_DATE_RE = _compile(r"Record\s*Date\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})", re.IGNORECASE)
+_PAYMENT_DATE_RE = _compile(r"Payment\s*Date\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})", re.IGNORECASE)
+_ANNOUNCEMENT_DATE_RE = _compile(r"(?:Date of this announcement|Announcement[- ]?Date)\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})", re.IGNORECASE)
+_DIVIDEND_RE = _compile(r"(?:Total dividend|Ordinary Dividend)[^0-9]*(?:per\s+(?:\+)?security)?[^\d]*(AUD\s+)?(\d+\.\d+)", re.IGNORECASE)
+# avoid matching 'unfranked': the text before 'franked' must not end in 'un'
+_FRANKING_RE = _compile(r"(?:Percentage of ordinary dividend|Percentage(?:.*(?:[^uU\n].|[uU][^nN\n])|.?)franked)\s*([0-9]{1,3})\.?\d*\s*%", re.IGNORECASE)
+_RATIO_RE = _compile(r"(?:ratio|split)[:\-\s]*(\d+\s*(?:for|:|\s+to\s+)\s*\d+)", re.IGNORECASE)
+
+# Field name -> pattern, scanned up front by parse(). These are deliberately
+# separate searches: a combined (?P<name>...) alternation scanned with finditer
+# has to try every alternative at each text position and cannot stop once a
+# field has its first hit. On the sample corpus it measured ~14x slower under re
+# and ~5x slower under RE2 than running the individual patterns.
+_FIELD_PATTERNS = [
+    ("company_name", _COMPANY_NAME_RE),
+    ("ticker", _TICKER_RE),
+    ("isin", _ISIN_RE),
+    ("ex_date", _EX_DATE_RE),
+    ("record_date", _RECORD_DATE_RE),
+    ("payment_date", _PAYMENT_DATE_RE),
+    ("announcement_date", _ANNOUNCEMENT_DATE_RE),
+    ("dividend_per_share", _DIVIDEND_RE),
+    ("franking_percentage", _FRANKING_RE),
+    ("ratio", _RATIO_RE),
+]
+
+_CURRENCY_RE = _compile(r"\b(AUD|USD|GBP|EUR|JPY|CNY)\b", re.IGNORECASE)
+
+# Fallback patterns
+_AUD_AMOUNT_RE = _compile(r"AUD\s+([0-9]+\.[0-9]+)")
+_FRANKING_FALLBACK_RES = [
+    _compile(r"([0-9]+\.?[0-9]*)\s*%\s*(?:franked|franking|percentage)", re.IGNORECASE),
+    _compile(r"Percentage of ordinary dividend.*?([0-9]+\.?[0-9]*)\s*%", re.IGNORECASE | re.DOTALL),
+    # number on its own line preceded by '3A.3' label
+    _compile(r"3A\.3[^\n]*\n\s*([0-9]+\.?[0-9]*)\s*%", re.IGNORECASE),
+    # generic search; matches any percentage, so nothing after it can ever be reached
+    _compile(r"(?:3A\.3[^\n]*\n)?\s*([0-9]+\.?[0-9]*)\s*%", re.IGNORECASE),
+]
 
 
 def snippet_from_match(text: str, match: re.Match, context: int = 50) -> str:
@@ -38,36 +119,81 @@ def snippet_from_match(text: str, match: re.Match, context: int = 50) -> str:
     return text[start:end].strip().replace("\n", " ")
 
 
+def _is_isin(value: str) -> bool:
+    """Check the AU ISIN shape: 'AU' followed by 10 uppercase letters or digits"""
+    return (
+        len(value) == 12
+        and value.startswith("AU")
+        and all("0" <= c <= "9" or "A" <= c <= "Z" for c in value[2:])
+    )
+
+
+# ISIN check digit: letters expand to two digits (A=10 ... Z=35), then Luhn mod 10
+# over the digit string. Both steps are table lookups done by translate().
+_ISIN_EXPAND = str.maketrans({c: str(ord(c) - 55) for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"})
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9]))
+
+
+def _isin_check_digit_ok(value: str) -> bool:
+    """Validate the check digit of an ISIN that already passed _is_isin"""
+    digits = value.translate(_ISIN_EXPAND).encode("ascii")
+    # every second digit from the right (starting with the check digit) is
+    # taken as is, the others are doubled with their digits summed
+    kept = digits[-1::-2]
+    total = sum(kept) - 48 * len(kept) + sum(digits[-2::-2].translate(_LUHN_DOUBLED))
+    return total % 10 == 0
+
+
 def adjust_confidence(conf: float, penalty: float) -> float:
     """Apply confidence penalty"""
     return max(0.0, conf - penalty)
 
 
+# Keywords for each type, checked in priority order. These use stdlib re rather than
+# _compile: the searches usually hit within the first few hundred characters, where
+# re beats RE2's per-call overhead.
+_DOCTYPE_RES = [
+    (DocumentType.DIVIDEND, re.compile(r"dividend|distribution", re.IGNORECASE)),
+    (DocumentType.SPLIT, re.compile(r"split|subdivision", re.IGNORECASE)),
+    (DocumentType.BONUS, re.compile(r"bonus|scrip", re.IGNORECASE)),
+    (DocumentType.RIGHTS, re.compile(r"rights|entitlements", re.IGNORECASE)),
+    (DocumentType.CAPITAL_RETURN, re.compile(r"capital|return|buyback", re.IGNORECASE)),
+]
+
+
 def detect_document_type(text: str) -> Optional[DocumentType]:
     """Detect document type from text"""
-    lower_text = text.lower()
-    
-    # Keywords for each type
-    type_keywords = {
-        DocumentType.DIVIDEND: ["dividend", "distribution"],
-        DocumentType.SPLIT: ["split", "subdivision"],
-        DocumentType.BONUS: ["bonus", "scrip"],
-        DocumentType.RIGHTS: ["rights", "entitlements"],
-        DocumentType.CAPITAL_RETURN: ["capital", "return", "buyback"],
-    }
-    
-    for dtype, keywords in type_keywords.items():
-        for kw in keywords:
-            if kw in lower_text:
-                return dtype
+    for dtype, pattern in _DOCTYPE_RES:
+        if pattern.search(text):
+            return dtype
     
     return None
 
 
-def parse(raw: Dict[str, Any]) -> ExtractionResult:
-    """Parse raw extraction to structured KPI result"""
-    pages = raw.get("pages", [])
-    full_text = "\n".join(p.get("text", "") for p in pages)
+def parse(raw: Union[Dict[str, Any], RawExtraction], full_text: Optional[str] = None) -> ExtractionResult:
+    """Parse raw extraction to structured KPI result
+
+    raw is the extractor's dict or a decoded RawExtraction. Callers that have
+    already joined the page texts with newlines can pass them as full_text to
+    skip rebuilding the string.
+    """
+    if isinstance(raw, RawExtraction):
+        page_texts = [p.text for p in raw.pages]
+    else:
+        page_texts = [p.get("text", "") for p in raw.get("pages", [])]
+    if full_text is None:
+        full_text = "\n".join(page_texts)
+    
+    # nothing can match blank text; skip the scans
+    if not full_text or full_text.isspace():
+        return ExtractionResult()
+
+    # start offset of each page within full_text, to map matches back to pages
+    page_offsets = []
+    offset = 0
+    for text in page_texts:
+        page_offsets.append(offset)
+        offset += len(text) + 1
     
     result = ExtractionResult()
     warnings: List[str] = []
@@ -75,14 +201,18 @@ def parse(raw: Dict[str, Any]) -> ExtractionResult:
     # document type detection
     result.document_type = detect_document_type(full_text)
 
-    # helper to search and assign
-    def assign_field(name: str, pattern: str, page_override: Optional[int] = None, 
+    # scan the text for every field once, then dispatch on field name
+    hits = {name: pattern.search(full_text) for name, pattern in _FIELD_PATTERNS}
+
+    # helper to assign a scanned match to its field
+    def assign_field(name: str, page_override: Optional[int] = None,
                     post_process=None, date_field=False) -> KPIField:
-        """Search for pattern and assign to field"""
-        match = find_pattern(full_text, pattern, flags=re.IGNORECASE)
+        """Assign the match found for name to its field"""
+        match = hits[name]
         field = getattr(result, name)
         
         if match:
+            confidence = 0.85
             # Get the captured group, or the whole match if no groups
             if match.groups():
                 val = match.group(1)
@@ -98,38 +228,33 @@ def parse(raw: Dict[str, Any]) -> ExtractionResult:
                 try:
                     val = post_process(val)
                 except Exception as e:
-                    field.confidence = 0.5
+                    confidence = 0.5
                     val = original_val
             
-            field.value = val
-            
-            # Find page number
-            page_num = 1
-            search_text = match.group(1) if match.groups() and match.group(1) else match.group(0)
-            for i, page in enumerate(pages, 1):
-                if search_text in page.get("text", ""):
-                    page_num = i
-                    break
+            if date_field and isinstance(val, date):
+                val = val.isoformat()
             
-            field.evidence = FieldEvidence(page=page_num, snippet=snippet_from_match(full_text, match))
+            # Find page number of the captured value
+            page_num = max(bisect.bisect_right(page_offsets, match.start(1)), 1)
             
-            if field.confidence == 0.0:
-                field.confidence = 0.85
-            
-            if date_field and isinstance(val, datetime):
-                field.value = val.date().isoformat()
+            field = KPIField(
+                value=val,
+                evidence=FieldEvidence(page=page_num, snippet=snippet_from_match(full_text, match)),
+                confidence=confidence,
+            )
+            setattr(result, name, field)
         
         return field
 
     # patterns for extraction
     # Company name - look for "Entity name" or "Name of +Entity"
-    assign_field("company_name", r"(?:Entity name|Name of \+Entity)\s+([A-Z][^\n]+)")
+    assign_field("company_name")
     
     # Ticker - look for "ASX issuer code" or "ASX +Security Code"
-    assign_field("ticker", r"(?:ASX\s+(?:\+)?[Ss]ecurity\s+[Cc]ode|ASX issuer code)\s+([A-Z]{1,5})\b")
+    assign_field("ticker")
     
     # ISIN - look for AU prefix
-    assign_field("isin", r"\b(AU[0-9A-Z]{10})\b")
+    assign_field("isin")
 
     # dates
     def date_pp(val: str):
@@ -139,33 +264,29 @@ def parse(raw: Dict[str, Any]) -> ExtractionResult:
         return d
 
     # Looking for patterns like "Ex Date\n22/4/2026"
-    assign_field("ex_date", r"(?:Ex\s*Date|Ex Date)\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})", post_process=date_pp, date_field=True)
-    assign_field("record_date", r"(?:Record\s*Date|Record Date)\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})", post_process=date_pp, date_field=True)
-    assign_field("payment_date", r"(?:Payment\s*Date|Payment Date)\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})", post_process=date_pp, date_field=True)
-    assign_field("announcement_date", r"(?:Date of this announcement|Announcement[- ]?Date)\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})", post_process=date_pp, date_field=True)
+    assign_field("ex_date", post_process=date_pp, date_field=True)
+    assign_field("record_date", post_process=date_pp, date_field=True)
+    assign_field("payment_date", post_process=date_pp, date_field=True)
+    assign_field("announcement_date", post_process=date_pp, date_field=True)
 
-    assign_field("dividend_per_share", r"(?:Total dividend|Ordinary Dividend)[^0-9]*(?:per\s+(?:\+)?security)?[^\d]*(AUD\s+)?(\d+\.\d+)")
+    assign_field("dividend_per_share")
     
     # Currency - more robust extraction
-    for curr in ['AUD', 'USD', 'GBP', 'EUR', 'JPY', 'CNY']:
-        curr_match = find_pattern(full_text, rf'{curr}\s*-\s*[^0-9]*(?:Dollar|Pound|Euro|Yen|Yuan)|{curr}(?:\s|$)', flags=re.IGNORECASE)
-        if not curr_match:
-            curr_match = find_pattern(full_text, rf'\b{curr}\b', flags=re.IGNORECASE)
-        if curr_match:
-            field = result.currency
-            field.value = curr.upper()
-            field.evidence = FieldEvidence(page=1, snippet=snippet_from_match(full_text, curr_match))
-            field.confidence = 0.95
-            break
+    curr_match = _CURRENCY_RE.search(full_text)
+    if curr_match:
+        result.currency = KPIField(
+            value=curr_match.group(1).upper(),
+            evidence=FieldEvidence(page=1, snippet=snippet_from_match(full_text, curr_match)),
+            confidence=0.95,
+        )
     
-    # avoid matching 'unfranked' by negative lookbehind for 'un'
-    assign_field("franking_percentage", r"(?:Percentage of ordinary dividend|Percentage.*(?<!un)franked)\s*([0-9]{1,3})\.?\d*\s*%")
-    assign_field("ratio", r"(?:ratio|split)[:\-\s]*(\d+\s*(?:for|:|\s+to\s+)\s*\d+)", page_override=None)
+    assign_field("franking_percentage")
+    assign_field("ratio", page_override=None)
 
     # Fallbacks for fields that may appear in different sections/lines
     # Dividend per share: look for nearby lines containing AUD amounts labelled as per security or per +security
     if not result.dividend_per_share.value:
-        aud_matches = re.findall(r"AUD\s+([0-9]+\.[0-9]+)", full_text)
+        aud_matches = _AUD_AMOUNT_RE.findall(full_text)
         if aud_matches:
             # prefer matches that occur near the phrase 'per' or 'per +security' in the text
             for m in aud_matches:
@@ -173,41 +294,42 @@ def parse(raw: Dict[str, Any]) -> ExtractionResult:
                 window = full_text[max(0, idx-80): idx+80].lower()
                 if 'per' in window or 'per +security' in window or 'per security' in window:
                     try:
-                        result.dividend_per_share.value = float(m)
-                        result.dividend_per_share.confidence = 0.9
-                        result.dividend_per_share.evidence = FieldEvidence(page=1, snippet=window.strip())
+                        result.dividend_per_share = KPIField(
+                            value=float(m),
+                            evidence=FieldEvidence(page=1, snippet=window.strip()),
+                            confidence=0.9,
+                        )
                         break
                     except Exception:
                         continue
             # if still not set, take first AUD amount as fallback
             if not result.dividend_per_share.value:
                 try:
-                    result.dividend_per_share.value = float(aud_matches[0])
-                    result.dividend_per_share.confidence = 0.7
-                    msearch = re.search(r"AUD\s+[0-9]+\.[0-9]+", full_text)
-                    result.dividend_per_share.evidence = FieldEvidence(page=1, snippet=snippet_from_match(full_text, msearch))
+                    msearch = _AUD_AMOUNT_RE.search(full_text)
+                    result.dividend_per_share = KPIField(
+                        value=float(aud_matches[0]),
+                        evidence=FieldEvidence(page=1, snippet=snippet_from_match(full_text, msearch)),
+                        confidence=0.7,
+                    )
                 except Exception:
                     pass
 
     # Franking percentage fallback: look for lines containing 'franked' with a percentage
-    if not result.franking_percentage.value:
-        fmatch = re.search(r"([0-9]+\.?[0-9]*)\s*%\s*(?:franked|franking|percentage)", full_text, flags=re.IGNORECASE)
-        if not fmatch:
-            fmatch = re.search(r"Percentage of ordinary dividend.*?([0-9]+\.?[0-9]*)\s*%", full_text, flags=re.IGNORECASE | re.DOTALL)
-        # additional search: number on its own line preceded by '3A.3' label
-        if not fmatch:
-            fmatch = re.search(r"3A\.3[^\n]*\n\s*([0-9]+\.?[0-9]*)\s*%", full_text, flags=re.IGNORECASE)
-        # fallback generic search (used earlier)
-        if not fmatch:
-            fmatch = re.search(r"(?:3A\.3[^\n]*\n)?\s*([0-9]+\.?[0-9]*)\s*%", full_text, flags=re.IGNORECASE)
-        # ultimate fallback: any number within 100 chars after 3A.3 label
-        if not fmatch:
-            fmatch = re.search(r"3A\.3[\s\S]{0,100}?([0-9]+\.?[0-9]*)\s*%", full_text, flags=re.IGNORECASE)
+    # Patterns are tried in priority order (first pattern to match anywhere wins), which a
+    # single alternation would not preserve. All of them need a '%', so skip when there is none.
+    if not result.franking_percentage.value and "%" in full_text:
+        fmatch = None
+        for fallback_re in _FRANKING_FALLBACK_RES:
+            fmatch = fallback_re.search(full_text)
+            if fmatch:
+                break
         if fmatch:
             try:
-                result.franking_percentage.value = float(fmatch.group(1))
-                result.franking_percentage.confidence = 0.9
-                result.franking_percentage.evidence = FieldEvidence(page=1, snippet=snippet_from_match(full_text, fmatch))
+                result.franking_percentage = KPIField(
+                    value=float(fmatch.group(1)),
+                    evidence=FieldEvidence(page=1, snippet=snippet_from_match(full_text, fmatch)),
+                    confidence=0.9,
+                )
             except Exception:
                 pass
 
@@ -228,24 +350,29 @@ def parse(raw: Dict[str, Any]) -> ExtractionResult:
     if ex and rec and pay:
         if not (ex <= rec <= pay):
             warnings.append("Date order validation failed: ex_date <= record_date <= payment_date")
-            result.ex_date.confidence = adjust_confidence(result.ex_date.confidence, 0.2)
-            result.record_date.confidence = adjust_confidence(result.record_date.confidence, 0.2)
-            result.payment_date.confidence = adjust_confidence(result.payment_date.confidence, 0.2)
+            for fname in ["ex_date", "record_date", "payment_date"]:
+                f = getattr(result, fname)
+                setattr(result, fname, msgspec.structs.replace(f, confidence=adjust_confidence(f.confidence, 0.2)))
 
     # isin validation
-    if result.isin.value and not re.match(r"^AU[0-9A-Z]{10}$", str(result.isin.value)):
-        warnings.append(f"ISIN format invalid: {result.isin.value}")
-        result.isin.confidence = adjust_confidence(result.isin.confidence, 0.3)
+    if result.isin.value:
+        isin = str(result.isin.value)
+        if not _is_isin(isin):
+            warnings.append(f"ISIN format invalid: {isin}")
+            result.isin = msgspec.structs.replace(result.isin, confidence=adjust_confidence(result.isin.confidence, 0.3))
+        elif not _isin_check_digit_ok(isin):
+            warnings.append(f"ISIN check digit invalid: {isin}")
+            result.isin = msgspec.structs.replace(result.isin, confidence=adjust_confidence(result.isin.confidence, 0.3))
 
     # numeric parsing
     for fname in ["dividend_per_share", "franking_percentage"]:
         f = getattr(result, fname)
         if f.value:
             try:
-                f.value = float(str(f.value).replace(",", ""))
+                setattr(result, fname, msgspec.structs.replace(f, value=float(str(f.value).replace(",", ""))))
             except Exception as e:
                 warnings.append(f"Numeric parse failed for {fname}: {f.value}")
-                f.confidence = adjust_confidence(f.confidence, 0.3)
+                setattr(result, fname, msgspec.structs.replace(f, confidence=adjust_confidence(f.confidence, 0.3)))
 
     # compute overall confidence
     kpi_fields = [
@@ -257,7 +384,22 @@ def parse(raw: Dict[str, Any]) -> ExtractionResult:
     
     confidences = [f.confidence for f in kpi_fields if f.value is not None]
     if confidences:
-        result.overall_confidence = sum(confidences) / len(confidences)
+        # clamped here, where the value is set, rather than by a schema hook
+        overall = sum(confidences) / len(confidences)
+        result.overall_confidence = 0.0 if overall < 0.0 else (1.0 if overall > 1.0 else overall)
     
     result.warnings = warnings
     return result
+
+
+def parse_batch(raws: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[ExtractionResult]:
+    """Parse many raw extractions across worker processes, preserving order
+
+    Patterns are compiled at import, so each worker builds them once and only
+    the raw dicts and results cross process boundaries.
+    """
+    workers = min(len(raws), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [parse(raw) for raw in raws]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(parse, raws, chunksize=8))
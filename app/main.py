@@ -3,27 +3,39 @@ FastAPI service for Corporate Action Intelligence (CAI)
 Offline-only MVP for KPI extraction from corporate action PDFs
 """
 
-import json
+import asyncio
+import hashlib
 import logging
+import multiprocessing
 import os
 import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Request
-from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
+from fastapi.responses import JSONResponse, FileResponse, HTMLResponse, ORJSONResponse, Response
 from fastapi.templating import Jinja2Templates
+import msgspec
+import orjson
 import uvicorn
 
 from app.extractor import PDFExtractor
 from app.kpi_parser import parse
 from app.schemas import ExtractionResult, RawExtraction
 from app.utils import (
+    append_index,
+    ensure_index,
     ensure_storage_dirs,
     generate_doc_id,
     pdf_path,
     raw_path,
+    read_index,
+    read_result,
     result_path,
+    summarize_result,
+    write_result,
 )
 
 # Setup logging
@@ -35,6 +47,7 @@ app = FastAPI(
     title="Corporate Action Intelligence (CAI)",
     description="Offline-only MVP for extracting KPIs from corporate action notices",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Templates for UI
@@ -42,7 +55,18 @@ templates = Jinja2Templates(directory="templates")
 
 # Initialize storage
 ensure_storage_dirs()
+ensure_index()
 extractor = PDFExtractor()
+# PyMuPDF is not thread-safe: every in-process extraction runs on this one thread
+_extract_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="extract")
+# /browse workers must not fork() this multi-threaded process (extraction and
+# OCR threads may be inside MuPDF); a forkserver starts them from a clean one.
+# Preloading app.main there pays its ~1 s import once, not once per worker
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _mp_context = multiprocessing.get_context("forkserver")
+    _mp_context.set_forkserver_preload(["__main__", "app.main"])
+else:
+    _mp_context = multiprocessing.get_context("spawn")
 
 
 @app.get("/health", tags=["System"])
@@ -61,18 +85,48 @@ def scan_folder(folder: str):
     result = []
     if not os.path.isdir(folder):
         return result
-    for root, dirs, files in os.walk(folder):
-        for name in files:
-            if name.lower().endswith('.pdf'):
-                path = os.path.join(root, name)
-                try:
-                    size = os.path.getsize(path)
-                except Exception:
-                    size = 0
-                result.append({"path": path, "size": size})
+    _scan_dir(folder, result)
     return result
 
 
+def _scan_dir(folder: str, result: list):
+    """Append pdf files under folder to result, in os.walk order"""
+    # scandir entries carry the file type, so only PDFs cost a stat() call
+    subdirs = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name.lower().endswith('.pdf'):
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        size = 0
+                    result.append({"path": entry.path, "size": size})
+    except OSError:
+        return
+    for path in subdirs:
+        _scan_dir(path, result)
+
+
+# Dividend-type patterns, matched against the lowercased text. One lower() copy is
+# cheaper than re.IGNORECASE here, which defeats re's literal-prefix scan.
+# Explicit ASX section headers are preferred when present.
+_ASX_PART_RES = [
+    (re.compile(r"part\s+3a\s*-\s*ordinary\s+dividend"), "ORDINARY"),
+    (re.compile(r"part\s+3b\s*-\s*interim\s+dividend"), "INTERIM"),
+    (re.compile(r"part\s+3c\s*-\s*special\s+dividend"), "SPECIAL"),
+    (re.compile(r"part\s+3d\s*-\s*final\s+dividend"), "FINAL"),
+]
+_EXPLICIT_TYPE_RE = re.compile(r"type of dividend/distribution\s+([a-z][a-z \-/]{2,40})")
+
+
 def detect_dividend_type_from_text(text: str) -> Optional[str]:
     """Infer dividend type from extracted document text."""
     if not text:
@@ -80,22 +134,12 @@ def detect_dividend_type_from_text(text: str) -> Optional[str]:
 
     lower = text.lower()
 
-    # Prefer explicit ASX section headers when present.
-    asx_part_patterns = [
-        (r"part\s+3a\s*-\s*ordinary\s+dividend", "ORDINARY"),
-        (r"part\s+3b\s*-\s*interim\s+dividend", "INTERIM"),
-        (r"part\s+3c\s*-\s*special\s+dividend", "SPECIAL"),
-        (r"part\s+3d\s*-\s*final\s+dividend", "FINAL"),
-    ]
-    for pattern, value in asx_part_patterns:
-        if re.search(pattern, lower):
+    for pattern, value in _ASX_PART_RES:
+        if pattern.search(lower):
             return value
 
     # Try to read explicit "Type of dividend/distribution" value blocks.
-    explicit = re.search(
-        r"type of dividend/distribution\s+([a-z][a-z \-/]{2,40})",
-        lower,
-    )
+    explicit = _EXPLICIT_TYPE_RE.search(lower)
     if explicit:
         raw_type = explicit.group(1).strip()
         if "ordinary" in raw_type:
@@ -114,11 +158,71 @@ def detect_dividend_type_from_text(text: str) -> Optional[str]:
         return "FINAL"
     if "special" in lower:
         return "SPECIAL"
-    if "ordinary dividend" in lower or "ordinary dividend/distribution" in lower:
+    if "ordinary dividend" in lower:
         return "ORDINARY"
     return None
 
 
+def _process_file(f: dict, doc_id: str) -> dict:
+    """Extract and parse one scanned PDF for /browse (runs in a worker process)"""
+    entry = f.copy()
+    entry["doc_id"] = doc_id
+    # copy the PDF into storage for reference
+    try:
+        shutil.copy(f["path"], pdf_path(doc_id))
+    except Exception:
+        pass
+    try:
+        # /browse already runs one worker process per core; a per-document OCR
+        # pool on top would start up to cores² Tesseract processes
+        extraction = extractor.extract_from_pdf(f["path"], ocr_workers=1)
+        extraction["doc_id"] = doc_id
+        # capture full text for later heuristics
+        pages = extraction.get("pages", [])
+        entry["full_text"] = "\n".join(p.get("text", "") for p in pages)
+
+        kpi = parse(extraction, full_text=entry["full_text"])
+        kpi.doc_id = doc_id
+        entry["kpi"] = msgspec.to_builtins(kpi)
+        # persist raw and result as /extract would have done
+        with open(raw_path(doc_id), 'w') as rf:
+            rf.write(extractor.serialize_extraction(extraction))
+        write_result(doc_id, kpi)
+        append_index(summarize_result(doc_id, entry["kpi"]))
+    except Exception as e:
+        entry["error"] = str(e)
+    return entry
+
+
+# SHA-256 of PDF content -> doc_id of a successful /browse entry, so rescanning a
+# folder (or a duplicate file) reuses the stored raw/result JSON instead of re-extracting
+_content_cache: Dict[str, str] = {}
+
+
+def _file_sha256(path: str) -> Optional[str]:
+    """Hash file content, or None if it cannot be read"""
+    try:
+        with open(path, 'rb') as fh:
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+    except OSError:
+        return None
+
+
+def _load_cached(f: dict, doc_id: str) -> Optional[dict]:
+    """Rebuild a /browse entry from the stored raw and result JSON of doc_id"""
+    try:
+        with open(raw_path(doc_id), 'rb') as rf:
+            extraction = msgspec.json.decode(rf.read(), type=RawExtraction)
+        kpi = read_result(doc_id)
+    except Exception:
+        return None
+    entry = f.copy()
+    entry["doc_id"] = doc_id
+    entry["full_text"] = "\n".join(p.text for p in extraction.pages)
+    entry["kpi"] = msgspec.to_builtins(kpi)
+    return entry
+
+
 @app.get("/browse", tags=["System"], response_class=HTMLResponse)
 def browse_get(request: Request):
     """Render folder scan form"""
@@ -129,50 +233,35 @@ def browse_get(request: Request):
 def browse_post(request: Request, path: str = Form(...)):
     """Handle form submission, scan and display results"""
     files = scan_folder(path)
-    # try to extract KPIs for each PDF file (non-blocking; failures are captured)
-    detailed = []
-    import shutil
-    from app.utils import pdf_path, raw_path, result_path
-
-    for f in files:
-        entry = f.copy()
-        doc_id = generate_doc_id()
-        entry["doc_id"] = doc_id
-        # copy the PDF into storage for reference
-        try:
-            shutil.copy(f["path"], pdf_path(doc_id))
-        except Exception:
-            pass
-        try:
-            extraction = extractor.extract_from_pdf(f["path"])
-            extraction["doc_id"] = doc_id
-            # capture full text for later heuristics
-            pages = extraction.get("pages", [])
-            entry["full_text"] = "\n".join(p.get("text", "") for p in pages)
-
-            kpi = parse(extraction)
-            kpi.doc_id = doc_id
-            entry["kpi"] = kpi.model_dump()
-            # persist raw and result as /extract would have done
-            with open(raw_path(doc_id), 'w') as rf:
-                rf.write(extractor.serialize_extraction(extraction))
-            with open(result_path(doc_id), 'w') as rf:
-                rf.write(kpi.model_dump_json(indent=2))
-        except Exception as e:
-            entry["error"] = str(e)
-        detailed.append(entry)
-    json_output = json.dumps(detailed, indent=2)
-    # create version without evidence for client consumption
-    def strip_evidence(obj):
-        if isinstance(obj, dict):
-            return {k: strip_evidence(v) for k, v in obj.items() if k != "evidence"}
-        elif isinstance(obj, list):
-            return [strip_evidence(v) for v in obj]
-        else:
-            return obj
-    clean = strip_evidence(detailed)
-
-    # additionally create a nicely structured payload per document
+    # extract KPIs for each PDF file in parallel (failures are captured per entry)
+    detailed = [None] * len(files)
+    hashes = [_file_sha256(f["path"]) for f in files]
+    # serve known content from storage; only the first copy of new content is processed
+    pending = {}
+    for i, (f, h) in enumerate(zip(files, hashes)):
+        cached_id = _content_cache.get(h) if h else None
+        if cached_id:
+            detailed[i] = _load_cached(f, cached_id)
+        if detailed[i] is None and (h is None or h not in pending):
+            pending[h if h else i] = i
+    if pending:
+        todo = list(pending.values())
+        doc_ids = [generate_doc_id() for _ in todo]
+        workers = min(len(todo), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context) as pool:
+            for i, entry in zip(todo, pool.map(_process_file, [files[i] for i in todo], doc_ids)):
+                detailed[i] = entry
+                if hashes[i] and "error" not in entry:
+                    _content_cache[hashes[i]] = entry["doc_id"]
+    for i, (f, h) in enumerate(zip(files, hashes)):
+        if detailed[i] is None:
+            # duplicate of a file processed in this scan
+            detailed[i] = {**detailed[pending[h]], "path": f["path"], "size": f["size"]}
+    # the "Raw JSON" panel of the template shows everything, evidence included
+    json_output = orjson.dumps(detailed, option=orjson.OPT_INDENT_2).decode()
+
+    # additionally create a nicely structured payload per document for client
+    # consumption; it only picks KPI values, so evidence never reaches it
     def make_struct(doc):
         k = doc.get("kpi") or {}
         text = doc.get("full_text", "")
@@ -198,8 +287,8 @@ def browse_post(request: Request, path: str = Form(...)):
                 "payment_date": k.get("payment_date", {}).get("value"),
             },
         }
-    structured = [make_struct(d) for d in clean]
-    json_structured = json.dumps(structured, indent=2)
+    structured = [make_struct(d) for d in detailed]
+    json_structured = orjson.dumps(structured, option=orjson.OPT_INDENT_2).decode()
 
     return templates.TemplateResponse(
         "browse.html",
@@ -237,16 +326,22 @@ async def extract_pdf(file: UploadFile = File(...)):
     pdf_file_path = pdf_path(doc_id)
     
     try:
-        # Save uploaded PDF
-        content = await file.read()
+        # Save uploaded PDF in 1 MiB chunks so large uploads are never held in memory
+        total_size = 0
         with open(pdf_file_path, 'wb') as f:
-            f.write(content)
+            while chunk := await file.read(1 << 20):
+                f.write(chunk)
+                total_size += len(chunk)
         
-        logger.info(f"PDF uploaded: {doc_id}, size={len(content)} bytes")
+        logger.info(f"PDF uploaded: {doc_id}, size={total_size} bytes")
         
-        # Start extraction (synchronous for MVP, can be async with Celery/Queue)
+        # Run extraction off the event loop so it keeps serving other requests;
+        # concurrent uploads queue on the single extraction thread
+        # (can move to Celery/Queue for heavier load)
         try:
-            extraction_result = extractor.extract_from_pdf(pdf_file_path)
+            extraction_result = await asyncio.get_running_loop().run_in_executor(
+                _extract_executor, extractor.extract_from_pdf, pdf_file_path
+            )
             extraction_result["doc_id"] = doc_id
             
             # Save raw extraction
@@ -255,13 +350,12 @@ async def extract_pdf(file: UploadFile = File(...)):
                 f.write(extractor.serialize_extraction(extraction_result))
             
             # Parse to KPIs
-            kpi_result = parse(extraction_result)
+            kpi_result = await asyncio.to_thread(parse, extraction_result)
             kpi_result.doc_id = doc_id
             
             # Save result
-            result_file_path = result_path(doc_id)
-            with open(result_file_path, 'w') as f:
-                f.write(kpi_result.model_dump_json(indent=2))
+            write_result(doc_id, kpi_result)
+            append_index(summarize_result(doc_id, msgspec.to_builtins(kpi_result)))
             
             logger.info(f"Extraction complete: {doc_id}")
             
@@ -310,9 +404,9 @@ def get_result(doc_id: str):
         )
     
     try:
-        with open(result_file, 'r') as f:
-            result_json = json.load(f)
-        return result_json
+        result = read_result(doc_id)
+        # a Response skips FastAPI's jsonable_encoder walk over the payload
+        return Response(content=msgspec.json.encode(result), media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to read result {doc_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to read result")
@@ -347,9 +441,10 @@ def get_raw_extraction(doc_id: str):
         )
     
     try:
-        with open(raw_file, 'r') as f:
-            raw_json = json.load(f)
-        return raw_json
+        with open(raw_file, 'rb') as f:
+            raw_json = orjson.loads(f.read())
+        # a Response skips FastAPI's jsonable_encoder walk over the payload
+        return ORJSONResponse(raw_json)
     except Exception as e:
         logger.error(f"Failed to read raw extraction {doc_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to read raw extraction")
@@ -376,22 +471,9 @@ def download_pdf(doc_id: str):
 @app.get("/list", tags=["System"])
 def list_documents():
     """List all processed documents"""
-    from app.utils import RESULT_DIR
-    
     docs = []
     try:
-        for filename in os.listdir(RESULT_DIR):
-            if filename.endswith('.json'):
-                doc_id = filename[:-5]
-                result_file = result_path(doc_id)
-                with open(result_file, 'r') as f:
-                    result = json.load(f)
-                docs.append({
-                    "doc_id": doc_id,
-                    "document_type": result.get("document_type"),
-                    "company_name": result.get("company_name", {}).get("value"),
-                    "overall_confidence": result.get("overall_confidence", 0)
-                })
+        docs = read_index()
     except Exception as e:
         logger.error(f"Failed to list documents: {e}")
     
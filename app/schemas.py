@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Optional, Union, List, Any
-from pydantic import BaseModel, Field, field_validator
+import msgspec
 from enum import Enum
 from datetime import datetime
 
@@ -13,43 +13,51 @@ class DocumentType(str, Enum):
     CAPITAL_RETURN = "CAPITAL_RETURN"
 
 
-class FieldEvidence(BaseModel):
+# FieldEvidence and KPIField only ever hold strings, numbers and each other, so
+# they can never form reference cycles: keep them out of the cycle collector
+class FieldEvidence(msgspec.Struct, gc=False):
     page: int
     snippet: str
 
 
-class KPIField(BaseModel):
+class KPIField(msgspec.Struct, frozen=True, gc=False):
     value: Optional[Union[str, float, int]] = None
     evidence: Optional[Union[FieldEvidence, List[FieldEvidence]]] = None
     confidence: float = 0.0
 
 
-class ExtractionResult(BaseModel):
+# Shared default for fields with no match; KPIField is frozen, so parse() swaps in
+# a new instance instead of mutating this one
+_EMPTY_FIELD = KPIField()
+
+
+class ExtractionResult(msgspec.Struct):
     doc_id: Optional[str] = None
     document_type: Optional[DocumentType] = None
-    company_name: KPIField = Field(default_factory=KPIField)
-    ticker: KPIField = Field(default_factory=KPIField)
-    isin: KPIField = Field(default_factory=KPIField)
-    ex_date: KPIField = Field(default_factory=KPIField)
-    record_date: KPIField = Field(default_factory=KPIField)
-    payment_date: KPIField = Field(default_factory=KPIField)
-    dividend_per_share: KPIField = Field(default_factory=KPIField)
-    currency: KPIField = Field(default_factory=KPIField)
-    franking_percentage: KPIField = Field(default_factory=KPIField)
-    ratio: KPIField = Field(default_factory=KPIField)
-    announcement_date: KPIField = Field(default_factory=KPIField)
+    company_name: KPIField = _EMPTY_FIELD
+    ticker: KPIField = _EMPTY_FIELD
+    isin: KPIField = _EMPTY_FIELD
+    ex_date: KPIField = _EMPTY_FIELD
+    record_date: KPIField = _EMPTY_FIELD
+    payment_date: KPIField = _EMPTY_FIELD
+    dividend_per_share: KPIField = _EMPTY_FIELD
+    currency: KPIField = _EMPTY_FIELD
+    franking_percentage: KPIField = _EMPTY_FIELD
+    ratio: KPIField = _EMPTY_FIELD
+    announcement_date: KPIField = _EMPTY_FIELD
     overall_confidence: float = 0.0
     warnings: List[str] = []
 
-    @field_validator("overall_confidence")
-    @classmethod
-    def clamp_confidence(cls, v):
-        return max(0.0, min(1.0, v))
 
+class PageText(msgspec.Struct):
+    page_num: int
+    text: str = ""
+    tables: List[str] = []
+    ocr_used: bool = False
 
-class RawExtraction(BaseModel):
-    doc_id: str
-    text_by_page: dict = {}
-    tables_by_page: dict = {}
+
+class RawExtraction(msgspec.Struct):
+    doc_id: Optional[str] = None
+    pages: List[PageText] = []
     ocr_used_pages: List[int] = []
-    extraction_timestamp: str
+    extraction_timestamp: Optional[str] = None
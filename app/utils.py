@@ -1,5 +1,10 @@
 import os
-import uuid
+import secrets
+
+import msgspec
+import orjson
+
+from app.schemas import ExtractionResult
 
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 DEFAULT_STORAGE_DIR = os.path.join(os.path.dirname(BASE_DIR), "storage")
@@ -8,26 +13,122 @@ STORAGE_DIR = os.path.abspath(os.getenv("STORAGE_ROOT", DEFAULT_STORAGE_DIR))
 PDF_DIR = os.path.join(STORAGE_DIR, "pdfs")
 RAW_DIR = os.path.join(STORAGE_DIR, "raw")
 RESULT_DIR = os.path.join(STORAGE_DIR, "results")
+# one JSON summary line per result, so /list does not open every result file
+INDEX_PATH = os.path.join(STORAGE_DIR, "index.jsonl")
+
+
+_ensured = False
 
 
 def ensure_storage_dirs():
+    global _ensured
+    if _ensured:
+        return
     for path in (PDF_DIR, RAW_DIR, RESULT_DIR):
         os.makedirs(path, exist_ok=True)
     # create templates folder if not exists
     os.makedirs(os.path.join(os.path.dirname(BASE_DIR), "templates"), exist_ok=True)
+    _ensured = True
 
 
 def generate_doc_id() -> str:
-    return uuid.uuid4().hex
+    # 32 lowercase hex chars, the same shape as uuid4().hex
+    return secrets.token_hex(16)
 
 
+# the storage dirs are absolute and fixed at import, so per-document paths are
+# plain f-strings rather than os.path.join calls
 def pdf_path(doc_id: str) -> str:
-    return os.path.join(PDF_DIR, f"{doc_id}.pdf")
+    return f"{PDF_DIR}{os.sep}{doc_id}.pdf"
 
 
 def raw_path(doc_id: str) -> str:
-    return os.path.join(RAW_DIR, f"{doc_id}.json")
+    return f"{RAW_DIR}{os.sep}{doc_id}.json"
 
 
 def result_path(doc_id: str) -> str:
-    return os.path.join(RESULT_DIR, f"{doc_id}.json")
+    return f"{RESULT_DIR}{os.sep}{doc_id}.json"
+
+
+def write_result(doc_id: str, result: ExtractionResult):
+    """Write a result to its file as indented JSON"""
+    with open(result_path(doc_id), "wb") as f:
+        f.write(msgspec.json.format(msgspec.json.encode(result), indent=2))
+
+
+def read_result(doc_id: str) -> ExtractionResult:
+    """Decode and validate a stored result in one step"""
+    with open(result_path(doc_id), "rb") as f:
+        return msgspec.json.decode(f.read(), type=ExtractionResult)
+
+
+def summarize_result(doc_id: str, result: dict) -> dict:
+    """Summary fields kept in the index for a result"""
+    return {
+        "doc_id": doc_id,
+        "document_type": result.get("document_type"),
+        "company_name": (result.get("company_name") or {}).get("value"),
+        "overall_confidence": result.get("overall_confidence", 0),
+    }
+
+
+def append_index(summary: dict):
+    """Append a result summary to the index"""
+    # a single small O_APPEND write, so concurrent workers do not interleave lines
+    with open(INDEX_PATH, "ab") as f:
+        f.write(orjson.dumps(summary) + b"\n")
+
+
+def read_index() -> list:
+    """Read result summaries from the index, latest line per doc_id"""
+    docs = {}
+    with open(INDEX_PATH, "rb") as f:
+        for line in f:
+            try:
+                summary = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if not isinstance(summary, dict) or "doc_id" not in summary:
+                continue
+            docs[summary["doc_id"]] = summary
+    return list(docs.values())
+
+
+def ensure_index():
+    """Build the index from existing result files if it does not exist yet
+
+    The index is only rebuilt when missing; delete index.jsonl to reconcile it
+    with the result files on disk (e.g. after removing or adding results by hand).
+    """
+    if os.path.exists(INDEX_PATH):
+        return
+    summaries = {}
+    for filename in os.listdir(RESULT_DIR):
+        if filename.endswith(".json"):
+            doc_id = filename[:-5]
+            try:
+                with open(result_path(doc_id), "rb") as f:
+                    result = orjson.loads(f.read())
+            except (OSError, orjson.JSONDecodeError):
+                continue
+            summaries[doc_id] = summarize_result(doc_id, result)
+    # per-process tmp file, so workers starting together never share one
+    tmp_path = f"{INDEX_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.writelines(orjson.dumps(summary) + b"\n" for summary in summaries.values())
+    try:
+        # link() never replaces an existing file, unlike os.replace()
+        os.link(tmp_path, INDEX_PATH)
+    except FileExistsError:
+        # another worker, or an append_index() call, created the index first:
+        # add only the results it does not list, so no appended line is lost
+        for doc_id in {summary["doc_id"] for summary in read_index()}:
+            summaries.pop(doc_id, None)
+        for summary in summaries.values():
+            append_index(summary)
+    except OSError:
+        # no hard links on this filesystem (SMB/CIFS, some volume mounts); the
+        # concurrent case is handled above, so replacing is safe here
+        os.replace(tmp_path, INDEX_PATH)
+        return
+    os.unlink(tmp_path)
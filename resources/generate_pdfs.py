@@ -5,31 +5,30 @@ Run this once to create PDFs: python resources/generate_pdfs.py
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph
+from xml.sax.saxutils import escape
 import os
 
+# Styles are built once and shared by every generate_pdf call
+styles = getSampleStyleSheet()
+
+# Custom style for body text
+body_style = ParagraphStyle(
+    'CustomBody',
+    parent=styles['Normal'],
+    fontSize=11,
+    leading=14,
+    spaceAfter=6,
+)
+
 def generate_pdf(text_content, output_path):
     """Generate PDF from text content"""
     doc = SimpleDocTemplate(output_path, pagesize=letter)
-    styles = getSampleStyleSheet()
     story = []
     
-    # Custom style for body text
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=11,
-        leading=14,
-        spaceAfter=6,
-    )
-    
-    # Split text into lines and add to story
-    for line in text_content.split('\n'):
-        if line.strip():
-            story.append(Paragraph(line, body_style))
-        else:
-            story.append(Spacer(1, 0.1*inch))
+    # One Paragraph for the whole text, lines joined with <br/>: reportlab parses
+    # the markup once instead of once per line (blank lines become empty lines)
+    story.append(Paragraph("<br/>".join(escape(line) for line in text_content.split('\n')), body_style))
     
     doc.build(story)
     print(f"✓ Created: {output_path}")
@@ -41,7 +40,7 @@ if __name__ == "__main__":
     dividend_text = """BHP Group Limited
 ABN 12 345 678 901
 ASX Code: BHP
-ISIN: AU0000014844
+ISIN: AU0000014847
 
 Notice of Dividend
 
@@ -4,36 +4,24 @@ No real PDFs required - uses example text strings
 """
 
 import pytest
-from app.kpi_parser import parse, parse_date, detect_document_type
-from app.schemas import DocumentType
+from datetime import date
+from app.kpi_parser import parse, parse_batch, parse_date, detect_document_type
+from app.schemas import DocumentType, ExtractionResult
 
 
 class TestDateParsing:
     """Test date parsing with multiple formats"""
     
-    def test_parse_date_dmy_long(self):
-        result = parse_date("15 March 2026")
-        assert result is not None
-        assert result.day == 15
-        assert result.month == 3
-        assert result.year == 2026
-    
-    def test_parse_date_dmy_short(self):
-        result = parse_date("15 Mar 2026")
-        assert result is not None
-        assert result.day == 15
-        assert result.month == 3
-    
-    def test_parse_date_iso(self):
-        result = parse_date("2026-03-15")
-        assert result is not None
-        assert result.year == 2026
-        assert result.month == 3
-        assert result.day == 15
-    
-    def test_parse_date_invalid(self):
-        result = parse_date("not a date")
-        assert result is None
+    @pytest.mark.parametrize("text, expected", [
+        ("15 March 2026", date(2026, 3, 15)),
+        ("15 Mar 2026", date(2026, 3, 15)),
+        ("2026-03-15", date(2026, 3, 15)),
+        ("15/3/2026", date(2026, 3, 15)),
+        ("15-03-2026", date(2026, 3, 15)),
+        ("not a date", None),
+    ])
+    def test_parse_date(self, text, expected):
+        assert parse_date(text) == expected
 
 
 class TestDocumentTypeDetection:
@@ -70,20 +58,17 @@ class TestDocumentTypeDetection:
         assert result is None
 
 
-class TestDividendExtraction:
-    """Test KPI extraction from dividend notice fixture"""
-    
-    @pytest.fixture
-    def dividend_notice_fixture(self):
-        """Dividend notice text fixture"""
-        return {
-            "pages": [
-                {
-                    "text": """
+@pytest.fixture(scope="module")
+def dividend_notice_fixture():
+    """Dividend notice text fixture"""
+    return {
+        "pages": [
+            {
+                "text": """
 BHP Group Limited
 ABN 12 345 678 901
 ASX Code: BHP
-ISIN: AU0000014844
+ISIN: AU0000014847
 
 Notice of Dividend
 
@@ -102,72 +87,68 @@ Franking tax credit: $0.1929 per share
 Currency: AUD
 
 For further information, please contact our Investor Relations team.
-                    """
-                }
-            ]
-        }
+                """
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="module")
+def dividend_result(dividend_notice_fixture):
+    """Parsed once and shared by every test in the module"""
+    return parse(dividend_notice_fixture)
+
+
+class TestDividendExtraction:
+    """Test KPI extraction from dividend notice fixture"""
     
-    def test_extract_company_name(self, dividend_notice_fixture):
-        result = parse(dividend_notice_fixture)
-        assert result.company_name.value == "BHP Group Limited"
-        assert result.company_name.confidence > 0.7
+    def test_extract_company_name(self, dividend_result):
+        assert dividend_result.company_name.value == "BHP Group Limited"
+        assert dividend_result.company_name.confidence > 0.7
     
-    def test_extract_ticker(self, dividend_notice_fixture):
-        result = parse(dividend_notice_fixture)
-        assert result.ticker.value == "BHP"
-        assert result.ticker.confidence > 0.7
+    def test_extract_ticker(self, dividend_result):
+        assert dividend_result.ticker.value == "BHP"
+        assert dividend_result.ticker.confidence > 0.7
     
-    def test_extract_isin(self, dividend_notice_fixture):
-        result = parse(dividend_notice_fixture)
-        assert result.isin.value == "AU0000014844"
-        assert result.isin.confidence > 0.7
+    def test_extract_isin(self, dividend_result):
+        assert dividend_result.isin.value == "AU0000014847"
+        assert dividend_result.isin.confidence > 0.7
     
-    def test_extract_dividend_per_share(self, dividend_notice_fixture):
-        result = parse(dividend_notice_fixture)
-        assert result.dividend_per_share.value == 0.45
-        assert result.dividend_per_share.confidence > 0.7
+    def test_extract_dividend_per_share(self, dividend_result):
+        assert dividend_result.dividend_per_share.value == 0.45
+        assert dividend_result.dividend_per_share.confidence > 0.7
     
-    def test_extract_dates(self, dividend_notice_fixture):
-        result = parse(dividend_notice_fixture)
-        
-        assert result.announcement_date.value == "2026-02-15"
-        assert result.ex_date.value == "2026-03-15"
-        assert result.record_date.value == "2026-03-17"
-        assert result.payment_date.value == "2026-04-01"
+    def test_extract_dates(self, dividend_result):
+        assert dividend_result.announcement_date.value == "2026-02-15"
+        assert dividend_result.ex_date.value == "2026-03-15"
+        assert dividend_result.record_date.value == "2026-03-17"
+        assert dividend_result.payment_date.value == "2026-04-01"
     
-    def test_date_order_validation(self, dividend_notice_fixture):
-        result = parse(dividend_notice_fixture)
+    def test_date_order_validation(self, dividend_result):
         # Date order should be correct: ex < record < payment
-        assert len(result.warnings) == 0
+        assert len(dividend_result.warnings) == 0
     
-    def test_extract_franking(self, dividend_notice_fixture):
-        result = parse(dividend_notice_fixture)
-        assert result.franking_percentage.value == 100.0
-        assert result.franking_percentage.confidence > 0.7
+    def test_extract_franking(self, dividend_result):
+        assert dividend_result.franking_percentage.value == 100.0
+        assert dividend_result.franking_percentage.confidence > 0.7
     
-    def test_extract_currency(self, dividend_notice_fixture):
-        result = parse(dividend_notice_fixture)
-        assert result.currency.value == "AUD"
+    def test_extract_currency(self, dividend_result):
+        assert dividend_result.currency.value == "AUD"
     
-    def test_document_type_dividend(self, dividend_notice_fixture):
-        result = parse(dividend_notice_fixture)
-        assert result.document_type == DocumentType.DIVIDEND
+    def test_document_type_dividend(self, dividend_result):
+        assert dividend_result.document_type == DocumentType.DIVIDEND
     
-    def test_overall_confidence_dividend(self, dividend_notice_fixture):
-        result = parse(dividend_notice_fixture)
-        assert result.overall_confidence > 0.75
+    def test_overall_confidence_dividend(self, dividend_result):
+        assert dividend_result.overall_confidence > 0.75
 
 
-class TestStockSplitExtraction:
-    """Test KPI extraction from stock split fixture"""
-    
-    @pytest.fixture
-    def stock_split_fixture(self):
-        """Stock split notice text fixture"""
-        return {
-            "pages": [
-                {
-                    "text": """
+@pytest.fixture(scope="module")
+def stock_split_fixture():
+    """Stock split notice text fixture"""
+    return {
+        "pages": [
+            {
+                "text": """
 Rio Tinto PLC
 ASX Code: RIO
 ISIN: AU96004458985
@@ -187,41 +168,44 @@ The new shares will be issued and trading will commence on
 additional shares automatically.
 
 Currency: AUD
-                    """
-                }
-            ]
-        }
+                """
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="module")
+def split_result(stock_split_fixture):
+    """Parsed once and shared by every test in the module"""
+    return parse(stock_split_fixture)
+
+
+class TestStockSplitExtraction:
+    """Test KPI extraction from stock split fixture"""
     
-    def test_extract_company_name_split(self, stock_split_fixture):
-        result = parse(stock_split_fixture)
-        assert "Rio Tinto" in str(result.company_name.value)
+    def test_extract_company_name_split(self, split_result):
+        assert "Rio Tinto" in str(split_result.company_name.value)
     
-    def test_extract_ticker_split(self, stock_split_fixture):
-        result = parse(stock_split_fixture)
-        assert result.ticker.value == "RIO"
+    def test_extract_ticker_split(self, split_result):
+        assert split_result.ticker.value == "RIO"
     
-    def test_extract_isin_split(self, stock_split_fixture):
-        result = parse(stock_split_fixture)
-        assert result.isin.value == "AU96004458985"
+    def test_extract_isin_split(self, split_result):
+        assert split_result.isin.value == "AU96004458985"
     
-    def test_extract_split_ratio(self, stock_split_fixture):
-        result = parse(stock_split_fixture)
-        assert result.ratio.value is not None
-        assert "1" in str(result.ratio.value)
-        assert "2" in str(result.ratio.value)
+    def test_extract_split_ratio(self, split_result):
+        assert split_result.ratio.value is not None
+        assert "1" in str(split_result.ratio.value)
+        assert "2" in str(split_result.ratio.value)
     
-    def test_extract_dates_split(self, stock_split_fixture):
-        result = parse(stock_split_fixture)
-        assert result.ex_date.value == "2026-05-01"
-        assert result.record_date.value == "2026-05-05"
+    def test_extract_dates_split(self, split_result):
+        assert split_result.ex_date.value == "2026-05-01"
+        assert split_result.record_date.value == "2026-05-05"
     
-    def test_document_type_split(self, stock_split_fixture):
-        result = parse(stock_split_fixture)
-        assert result.document_type == DocumentType.SPLIT
+    def test_document_type_split(self, split_result):
+        assert split_result.document_type == DocumentType.SPLIT
     
-    def test_overall_confidence_split(self, stock_split_fixture):
-        result = parse(stock_split_fixture)
-        assert result.overall_confidence > 0.60
+    def test_overall_confidence_split(self, split_result):
+        assert split_result.overall_confidence > 0.60
 
 
 class TestValidationRules:
@@ -263,6 +247,12 @@ Dividend: $0.50
             ]
         }
     
+    def test_isin_check_digit_fails(self):
+        result = parse({"pages": [{"text": "ISIN: AU0000014844\nDividend: $0.50"}]})
+        assert result.isin.value == "AU0000014844"
+        assert any("ISIN check digit" in w for w in result.warnings)
+        assert result.isin.confidence < 0.9
+    
     def test_date_order_validation_fails(self, invalid_date_order_fixture):
         result = parse(invalid_date_order_fixture)
         # Should have warning about date order
@@ -309,6 +299,10 @@ class TestEdgeCases:
         assert result.company_name.value is None
         assert result.overall_confidence == 0.0
     
+    def test_whitespace_only_pages(self):
+        result = parse({"pages": [{"text": "  \n\t"}, {"text": ""}]})
+        assert result == ExtractionResult()
+    
     def test_partial_data(self):
         raw = {"pages": [{"text": "BHP Group Limited\nDividend: $0.50"}]}
         result = parse(raw)
@@ -338,5 +332,22 @@ class TestEdgeCases:
         assert result.dividend_per_share.value == 0.45
 
 
+class TestBatchParsing:
+    """Test parsing several documents at once"""
+    
+    def test_parse_batch_matches_parse(self):
+        raws = [
+            {"pages": [{"text": "Entity name ARIADNE AUSTRALIA LIMITED\nASX issuer code ARA"}]},
+            {"pages": [{"text": "Ex Date 22/4/2026\nRecord Date 23/4/2026"}]},
+            {"pages": [{"text": ""}]},
+        ]
+        results = parse_batch(raws, max_workers=2)
+        assert results == [parse(raw) for raw in raws]
+        assert results[0].ticker.value == "ARA"
+    
+    def test_parse_batch_empty(self):
+        assert parse_batch([]) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])